@@ -19,6 +19,7 @@ interface WebSocketMessage {
   progress?: number;
   message?: string;
   affectsReadiness?: boolean;
+  truncated?: boolean;
 }
 
 interface UseWebSocketOptions {
@@ -138,6 +139,11 @@ export function useWebSocket({
               if (message.text) onPartialRef.current?.(message.text);
               break;
             case 'final':
+              if (message.truncated) {
+                console.warn(
+                  'Recording hit the server length limit; later audio was not transcribed'
+                );
+              }
               onFinalRef.current?.(message.text || '');
               break;
             case 'error':
@@ -0,0 +1,47 @@
+"""16-bit PCM decoding for incoming audio."""
+
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+PCM_DTYPE = np.dtype(np.int16)
+
+# float32 scalar so both decode paths stay in float32 without promoting; Numba
+# freezes it into the compiled kernel as a constant
+PCM_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _decode_loop(src: np.ndarray, out: np.ndarray) -> None:
+    for i in range(src.size):
+        out[i] = src[i] * PCM_SCALE
+
+
+if njit is not None:
+    # Compiled code is cached beside the module. A frozen (PyInstaller) build has
+    # no source tree for Numba to cache against, so it compiles once per process.
+    _decode_kernel = njit(
+        cache=not getattr(sys, "frozen", False),
+        fastmath=True,
+        boundscheck=False,
+    )(_decode_loop)
+else:
+    _decode_kernel = None
+
+
+def pcm16_to_float32(data: bytes | bytearray) -> np.ndarray:
+    """Decode 16-bit PCM bytes to float32 samples in [-1, 1).
+
+    A trailing odd byte (half a sample) is ignored.
+    """
+    samples = np.frombuffer(data, dtype=PCM_DTYPE, count=len(data) // PCM_DTYPE.itemsize)
+    out = np.empty(samples.shape, dtype=np.float32)
+    if _decode_kernel is not None:
+        _decode_kernel(samples, out)
+    else:
+        np.multiply(samples, PCM_SCALE, out=out)
+    return out
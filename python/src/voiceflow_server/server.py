@@ -1,33 +1,84 @@
 """WebSocket server for real-time speech-to-text transcription."""
 
 import asyncio
-import json
+import importlib.util
 import logging
-import signal
-import sys
-import tempfile
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Optional, Set
 
 import numpy as np
-import soundfile as sf
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
+from voiceflow_server.pcm import PCM_DTYPE, pcm16_to_float32
+
+# The model stack (parakeet-mlx on MLX) targets Apple Silicon. Import it once at
+# startup so model loading only pays for reading weights; where any of it is
+# missing the server still runs and reports the load error to clients.
+try:
+    import librosa
+    import mlx.core as mx
+    import mlx.nn as nn
+    from huggingface_hub import try_to_load_from_cache
+    from parakeet_mlx import from_pretrained
+    from parakeet_mlx.audio import get_logmel
+    from parakeet_mlx.utils import from_config
+except ImportError:
+    librosa = None
+    mx = None
+    nn = None
+    try_to_load_from_cache = None
+    from_pretrained = None
+    get_logmel = None
+    from_config = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger("voiceflow")
 
+# Hugging Face repository of the MLX-converted parakeet model
+MODEL_ID = "mlx-community/parakeet-tdt-0.6b-v3"
+
+# Weight-only quantization of the linear layers, which dominate decoder memory
+# traffic. The quantized copy is cached so later starts skip the bf16 load; its
+# metadata records what it was built from, and a mismatch rebuilds it.
+QUANTIZATION_BITS = 8
+QUANTIZATION_GROUP_SIZE = 64
+QUANTIZED_MODEL_DIR = (
+    Path.home() / ".cache" / "voiceflow" / f"parakeet-tdt-0.6b-v3-q{QUANTIZATION_BITS}"
+)
+
 # Global transcriber instance
 transcriber: Optional["Transcriber"] = None
 
 # Connected WebSocket clients for broadcasting loading progress
 connected_clients: Set[WebSocket] = set()
 
+# Finished recordings a connection may queue while an earlier one is transcribed
+TRANSCRIPTION_QUEUE_SIZE = 4
+
+# Longest recording kept per utterance; later audio is dropped so a client that
+# never sends "end" cannot grow the buffer without bound (~9.6MB of PCM)
+MAX_RECORDING_SECONDS = 300
+
+
+def get_transcriber() -> Optional["Transcriber"]:
+    """Return the transcriber created at startup, or None before lifespan runs."""
+    return transcriber
+
+
+async def send_json(websocket: WebSocket, payload: dict[str, object]):
+    """Send a JSON control message as a text frame, encoded with orjson."""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
 
 async def broadcast_loading_status(stage: str, progress: float, message: str):
     """Broadcast loading status to all connected clients."""
@@ -41,15 +92,17 @@ async def broadcast_loading_status(stage: str, progress: float, message: str):
         "message": message,
     }
 
-    disconnected = set()
-    for client in tuple(connected_clients):
-        try:
-            await client.send_json(payload)
-        except Exception:
-            disconnected.add(client)
+    # Send to every client concurrently rather than one await at a time
+    clients = tuple(connected_clients)
+    results = await asyncio.gather(
+        *(send_json(client, payload) for client in clients),
+        return_exceptions=True,
+    )
 
     # Remove disconnected clients
-    connected_clients.difference_update(disconnected)
+    connected_clients.difference_update(
+        client for client, result in zip(clients, results) if isinstance(result, Exception)
+    )
 
 
 def websocket_error(error: str, *, affects_readiness: bool = False) -> dict[str, object]:
@@ -64,16 +117,20 @@ def websocket_error(error: str, *, affects_readiness: bool = False) -> dict[str,
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize transcriber on startup."""
+    """Initialize transcriber on startup and release it on shutdown."""
     global transcriber
     transcriber = Transcriber()
     transcriber.ensure_loading()
     yield
+    logger.info("Shutting down...")
     active_task = getattr(transcriber, "_load_task", None) if transcriber else None
     if active_task and not active_task.done():
         active_task.cancel()
         with suppress(asyncio.CancelledError):
             await active_task
+    executor = getattr(transcriber, "_executor", None) if transcriber else None
+    if executor:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(title="VoiceFlow Server", lifespan=lifespan)
@@ -92,9 +149,48 @@ app.add_middleware(
 )
 
 
+def quantized_cache_metadata(source_config: Path) -> dict[str, object]:
+    """Describe a quantized cache built from the snapshot holding `source_config`."""
+    return {
+        # Hub snapshots live under snapshots/<revision>/
+        "source_revision": source_config.parent.name,
+        "bits": QUANTIZATION_BITS,
+        "group_size": QUANTIZATION_GROUP_SIZE,
+    }
+
+
+def quantize_model(model) -> None:
+    """Quantize the model's linear layers in place."""
+    nn.quantize(
+        model,
+        group_size=QUANTIZATION_GROUP_SIZE,
+        bits=QUANTIZATION_BITS,
+        class_predicate=lambda _, module: (
+            isinstance(module, nn.Linear)
+            and module.weight.shape[-1] % QUANTIZATION_GROUP_SIZE == 0
+        ),
+    )
+
+
 class Transcriber:
     """Wrapper for parakeet-mlx transcription."""
 
+    __slots__ = (
+        "model",
+        "_loading",
+        "_loaded",
+        "_load_lock",
+        "_load_task",
+        "_loop",
+        "_executor",
+        "_inference_slot",
+        "load_error",
+        "loading_stage",
+        "loading_progress",
+        "loading_message",
+        "_last_broadcast",
+    )
+
     def __init__(self):
         self.model = None
         self._loading = False
@@ -102,10 +198,15 @@ class Transcriber:
         self._load_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Task[None]] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Dedicated single worker so model work never queues behind (or blocks)
+        # the default executor, and inference stays on one thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parakeet")
+        self._inference_slot = asyncio.Semaphore(1)
         self.load_error: Optional[str] = None
         self.loading_stage = ""
         self.loading_progress = 0.0
         self.loading_message = ""
+        self._last_broadcast: Optional[tuple[str, float, str]] = None
 
     async def wait_until_ready(self) -> None:
         """Wait until the model is fully loaded and ready for transcription."""
@@ -113,6 +214,11 @@ class Transcriber:
 
     def _broadcast_sync(self, stage: str, progress: float, message: str):
         """Broadcast loading status from sync context."""
+        # Progress hooks can repeat the same status; only schedule changes
+        if (stage, progress, message) == self._last_broadcast:
+            return
+        self._last_broadcast = (stage, progress, message)
+
         self.loading_stage = stage
         self.loading_progress = progress
         self.loading_message = message
@@ -150,6 +256,7 @@ class Transcriber:
             self._loaded.clear()
             self.model = None
             self.load_error = None
+            self._last_broadcast = None
             self._loop = asyncio.get_running_loop()
             logger.info("Loading parakeet model...")
 
@@ -157,8 +264,9 @@ class Transcriber:
 
             try:
                 # Import and load in thread pool to avoid blocking
-                loop = asyncio.get_running_loop()
-                self.model = await loop.run_in_executor(None, self._load_model_sync)
+                self.model = await self._loop.run_in_executor(
+                    self._executor, lambda: self._load_model_sync(force=force)
+                )
                 await broadcast_loading_status("ready", 1.0, "Model ready")
                 logger.info("Parakeet model loaded successfully")
             except Exception as e:
@@ -200,68 +308,128 @@ class Transcriber:
         self._broadcast_sync("warmup", 0.9, "Warming up model...")
         logger.info("Warming up model...")
         try:
-            # Create 0.5 seconds of silent audio at 16kHz
-            silent_audio = np.zeros(8000, dtype=np.float32)
-
-            # Write to temp file and run inference
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_path = Path(f.name)
+            # Decode 0.5 seconds of silent 16kHz PCM, which also compiles the
+            # PCM kernel before the first real recording
+            silent_audio = pcm16_to_float32(bytearray(16000))
 
-            try:
-                sf.write(temp_path, silent_audio, 16000)
-                _ = model.transcribe(temp_path)  # Discard result
-            finally:
-                temp_path.unlink(missing_ok=True)
+            # Run inference in memory exactly like a real request
+            _ = self._transcribe_sync(silent_audio, 16000, model=model)  # Discard result
 
             logger.info("Warmup complete - model ready for fast transcription")
         except Exception as e:
             logger.warning(f"Warmup failed (non-critical): {e}")
 
-    def _load_model_sync(self):
+    def _load_model_sync(self, force: bool = False):
         """Synchronous model loading.
 
         The model (mlx-community/parakeet-tdt-0.6b-v3, ~600MB) will be downloaded
         automatically from Hugging Face on first run and cached locally at:
         ~/.cache/huggingface/hub/
-        """
-        try:
-            from parakeet_mlx import from_pretrained
 
-            # Check if model is cached by looking for cache directory
-            self._broadcast_sync("downloading", 0.1, "Checking model cache...")
+        Its quantized copy is cached at ~/.cache/voiceflow/ and used on later starts.
+        A forced reload skips that copy and rebuilds it from the full model.
+        """
+        if from_pretrained is None:
+            logger.error("parakeet-mlx not available")
+            raise RuntimeError("parakeet-mlx is not installed in the server environment")
 
-            # Try to set up progress callback for huggingface_hub downloads
-            try:
-                # Check if model is already cached
-                cache_path = Path.home() / ".cache" / "huggingface" / "hub"
-                model_cache = cache_path / "models--mlx-community--parakeet-tdt-0.6b-v3"
-
-                if model_cache.exists():
-                    self._broadcast_sync("loading", 0.3, "Loading model from cache...")
-                else:
-                    self._broadcast_sync("downloading", 0.1, "Downloading model (~600MB)...")
-                    # Note: Progress updates during actual download handled by tqdm
-                    # which huggingface_hub uses internally
-            except ImportError:
-                pass
-
-            # Load the MLX-converted parakeet model from mlx-community
-            # First run will download ~600MB from Hugging Face
-            logger.info("Loading mlx-community/parakeet-tdt-0.6b-v3 (downloads ~600MB on first run)...")
-            self._broadcast_sync("loading", 0.5, "Loading model into memory...")
-            model = from_pretrained("mlx-community/parakeet-tdt-0.6b-v3")
+        try:
+            model = None if force else self._load_quantized_cache()
+            if model is None:
+                model = self._load_pretrained_model()
 
             # Warmup the model to avoid cold start latency
             self._warmup(model)
 
             return model
-        except ImportError as e:
-            logger.error("parakeet-mlx not available")
-            raise RuntimeError("parakeet-mlx is not installed in the server environment") from e
         except Exception as e:
             logger.error(f"Error loading parakeet model: {e}")
             raise
 
+    def _load_quantized_cache(self):
+        """Load the quantized model saved by an earlier run, if there is one."""
+        config_path = QUANTIZED_MODEL_DIR / "config.json"
+        weights_path = QUANTIZED_MODEL_DIR / "model.safetensors"
+        metadata_path = QUANTIZED_MODEL_DIR / "metadata.json"
+        if not (config_path.exists() and weights_path.exists() and metadata_path.exists()):
+            return None
+
+        try:
+            metadata = orjson.loads(metadata_path.read_bytes())
+            expected = {"bits": QUANTIZATION_BITS, "group_size": QUANTIZATION_GROUP_SIZE}
+            # Without a hub snapshot there is nothing newer to rebuild from
+            source_config = try_to_load_from_cache(MODEL_ID, "config.json")
+            if isinstance(source_config, str):
+                expected = quantized_cache_metadata(Path(source_config))
+            if any(metadata.get(key) != value for key, value in expected.items()):
+                logger.info("Quantized model cache is out of date, rebuilding it")
+                return None
+
+            logger.info(f"Loading quantized model from {QUANTIZED_MODEL_DIR}...")
+            self._broadcast_sync("loading", 0.5, "Loading model from cache...")
+            model = from_config(orjson.loads(config_path.read_bytes()))
+            quantize_model(model)
+            model.load_weights(str(weights_path))
+            return model
+        except Exception as e:
+            logger.warning(f"Ignoring unusable quantized model cache: {e}")
+            return None
+
+    def _save_quantized_cache(self, model, config_path: Path):
+        """Save quantized weights next to the model config for later starts."""
+        try:
+            QUANTIZED_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+            # The metadata is what makes the cache usable, so it is removed first
+            # and written last; a crash in between leaves a cache that is ignored
+            metadata_path = QUANTIZED_MODEL_DIR / "metadata.json"
+            metadata_path.unlink(missing_ok=True)
+            # Written under a temporary name so a crash never leaves a partial file
+            # where _load_quantized_cache looks for one
+            partial_path = QUANTIZED_MODEL_DIR / "model.partial.safetensors"
+            model.save_weights(str(partial_path))
+            shutil.copyfile(config_path, QUANTIZED_MODEL_DIR / "config.json")
+            os.replace(partial_path, QUANTIZED_MODEL_DIR / "model.safetensors")
+            metadata_path.write_bytes(orjson.dumps(quantized_cache_metadata(config_path)))
+        except Exception as e:
+            logger.warning(f"Failed to cache quantized model (non-critical): {e}")
+
+    def _load_pretrained_model(self):
+        """Load the full-precision model from Hugging Face and quantize it."""
+        # Check if model is cached by looking for cache directory
+        self._broadcast_sync("downloading", 0.1, "Checking model cache...")
+
+        # Check if model is already cached (honours HF_HOME / HF_HUB_CACHE)
+        model_source = MODEL_ID
+        cached_files = [
+            try_to_load_from_cache(MODEL_ID, filename)
+            for filename in ("config.json", "model.safetensors")
+        ]
+
+        if all(isinstance(path, str) for path in cached_files):
+            # Load straight from the cached snapshot so a warm start skips
+            # the hub's per-file revalidation requests
+            model_source = str(Path(cached_files[1]).parent)
+            self._broadcast_sync("loading", 0.3, "Loading model from cache...")
+        else:
+            self._broadcast_sync("downloading", 0.1, "Downloading model (~600MB)...")
+            # Note: Progress updates during actual download handled by tqdm
+            # which huggingface_hub uses internally
+
+        # Load the MLX-converted parakeet model from mlx-community
+        # First run will download ~600MB from Hugging Face
+        logger.info(f"Loading {MODEL_ID} (downloads ~600MB on first run)...")
+        self._broadcast_sync("loading", 0.5, "Loading model into memory...")
+        model = from_pretrained(model_source)
+
+        self._broadcast_sync("loading", 0.7, "Optimizing model...")
+        quantize_model(model)
+
+        config_path = try_to_load_from_cache(MODEL_ID, "config.json")
+        if isinstance(config_path, str):
+            self._save_quantized_cache(model, Path(config_path))
+
+        return model
+
     async def transcribe(self, audio_data: np.ndarray, sample_rate: int = 16000) -> str:
         """Transcribe audio data to text."""
         await self._loaded.wait()
@@ -271,57 +439,87 @@ class Transcriber:
             raise RuntimeError(error_message)
 
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, lambda: self._transcribe_sync(audio_data, sample_rate)
-            )
+            # load_model captured the loop; fall back for a model set directly
+            loop = self._loop or asyncio.get_running_loop()
+            # One inference at a time across all connections; waiting here rather
+            # than in the executor queue means a cancelled request never runs
+            async with self._inference_slot:
+                result = await loop.run_in_executor(
+                    self._executor, lambda: self._transcribe_sync(audio_data, sample_rate)
+                )
             return result
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             raise
 
-    def _transcribe_sync(self, audio_data: np.ndarray, sample_rate: int) -> str:
-        """Synchronous transcription using temp file."""
-        # Save audio to temp file (parakeet-mlx expects file path)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = Path(f.name)
+    def _transcribe_sync(self, audio_data: np.ndarray, sample_rate: int, model=None) -> str:
+        """Synchronous transcription of in-memory audio.
 
-        try:
-            # Write audio data to temp file
-            sf.write(temp_path, audio_data, sample_rate)
+        The float32 samples are resampled if needed and turned into a log-mel
+        spectrogram in process, which is what model.transcribe does after
+        decoding a file through ffmpeg. `model` defaults to the loaded model;
+        warmup passes the one still being loaded.
+        """
+        if model is None:
+            model = self.model
 
-            # Transcribe
-            result = self.model.transcribe(temp_path)
-            return result.text.strip() if hasattr(result, 'text') else str(result).strip()
-        finally:
-            # Clean up temp file
-            temp_path.unlink(missing_ok=True)
+        preprocessor_config = model.preprocessor_config
+        if sample_rate != preprocessor_config.sample_rate:
+            audio_data = librosa.resample(
+                audio_data, orig_sr=sample_rate, target_sr=preprocessor_config.sample_rate
+            )
+
+        # Too short to produce a single mel frame
+        if len(audio_data) < preprocessor_config.hop_length:
+            return ""
+
+        mel = get_logmel(mx.array(audio_data), preprocessor_config)
+        result = model.generate(mel)[0]
+        return result.text.strip() if hasattr(result, 'text') else str(result).strip()
 
 
 class AudioBuffer:
-    """Buffer for accumulating audio chunks."""
+    """Buffer for accumulating audio chunks.
 
-    def __init__(self, sample_rate: int = 16000):
+    Chunks are kept as the raw 16-bit PCM bytes received from the socket and
+    decoded to float32 once, when the audio is read for transcription.
+    """
+
+    __slots__ = ("sample_rate", "_raw", "_max_bytes")
+
+    def __init__(self, sample_rate: int = 16000, max_seconds: Optional[float] = None):
         self.sample_rate = sample_rate
-        self.chunks: list[np.ndarray] = []
-        self.total_samples = 0
+        self._raw = bytearray()
+        self._max_bytes = (
+            None if max_seconds is None
+            else int(max_seconds * sample_rate) * PCM_DTYPE.itemsize
+        )
+
+    def add_chunk(self, data: bytes | bytearray) -> bool:
+        """Add a chunk of 16-bit PCM audio.
+
+        Returns False if the buffer is full and some of the chunk was dropped.
+        """
+        if self._max_bytes is not None:
+            room = self._max_bytes - len(self._raw)
+            if len(data) > room:
+                self._raw.extend(data[:max(room, 0)])
+                return False
+        self._raw.extend(data)
+        return True
 
-    def add_chunk(self, data: bytes):
-        """Add a chunk of 16-bit PCM audio."""
-        audio = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-        self.chunks.append(audio)
-        self.total_samples += len(audio)
+    @property
+    def total_samples(self) -> int:
+        """Get the number of complete samples buffered."""
+        return len(self._raw) // PCM_DTYPE.itemsize
 
     def get_audio(self) -> np.ndarray:
-        """Get accumulated audio as a single array."""
-        if not self.chunks:
-            return np.array([], dtype=np.float32)
-        return np.concatenate(self.chunks)
+        """Get accumulated audio as a single float32 array."""
+        return pcm16_to_float32(self._raw)
 
     def clear(self):
         """Clear the buffer."""
-        self.chunks = []
-        self.total_samples = 0
+        self._raw.clear()
 
     @property
     def duration(self) -> float:
@@ -332,6 +530,7 @@ class AudioBuffer:
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    transcriber = get_transcriber()
     if transcriber is None:
         return {
             "status": "starting",
@@ -349,6 +548,7 @@ async def health_check():
 @app.post("/model/reload", status_code=202)
 async def reload_model():
     """Retry model initialization without restarting the app."""
+    transcriber = get_transcriber()
     if transcriber is None:
         raise HTTPException(status_code=503, detail="Transcriber is not initialized yet")
 
@@ -359,6 +559,45 @@ async def reload_model():
     }
 
 
+async def transcribe_recordings(
+    websocket: WebSocket,
+    recordings: asyncio.Queue[tuple[np.ndarray, bool]],
+):
+    """Transcribe finished recordings in order and send each result to the client.
+
+    Runs beside the receive loop of websocket_endpoint, so audio for the next
+    recording can stream in while the previous one is still being transcribed.
+    A recording cut at MAX_RECORDING_SECONDS is flagged "truncated" on its final
+    message, so the client knows the text covers only the start.
+    """
+    transcriber = get_transcriber()
+    while True:
+        audio, truncated = await recordings.get()
+        logger.info(f"Processing {len(audio)} samples...")
+        try:
+            text = ""
+            if len(audio) > 0 and transcriber:
+                try:
+                    text = await transcriber.transcribe(audio)
+                    logger.info(f"Transcription: {text}")
+                except Exception as transcribe_error:
+                    logger.error(f"Transcription failed: {transcribe_error}")
+                    await send_json(websocket, websocket_error(str(transcribe_error)))
+                    continue
+            else:
+                logger.info("No audio or transcriber not available")
+            result: dict[str, object] = {"type": "final", "text": text}
+            if truncated:
+                result["truncated"] = True
+            await send_json(websocket, result)
+        except Exception as send_error:
+            # The receive loop notices the disconnect and tears the connection down
+            logger.debug(f"Failed to send transcription to client: {send_error}")
+            return
+        finally:
+            recordings.task_done()
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for audio streaming and transcription."""
@@ -368,25 +607,35 @@ async def websocket_endpoint(websocket: WebSocket):
     # Track this client for loading broadcasts
     connected_clients.add(websocket)
 
-    audio_buffer = AudioBuffer()
+    audio_buffer = AudioBuffer(max_seconds=MAX_RECORDING_SECONDS)
     is_recording = False
+    is_truncated = False
+
+    recordings: asyncio.Queue[tuple[np.ndarray, bool]] = asyncio.Queue(
+        maxsize=TRANSCRIPTION_QUEUE_SIZE
+    )
+    transcription_task = asyncio.create_task(transcribe_recordings(websocket, recordings))
+
+    # Created during lifespan startup, so it is fixed for the life of the connection
+    transcriber = get_transcriber()
 
     try:
         # Send current server state immediately so the client can recover in place.
         if transcriber:
             if transcriber._loading:
-                await websocket.send_json({
+                await send_json(websocket, {
                     "type": "loading",
                     "stage": transcriber.loading_stage or "loading",
                     "progress": transcriber.loading_progress,
                     "message": transcriber.loading_message or "Loading model...",
                 })
             elif transcriber.load_error:
-                await websocket.send_json(
+                await send_json(
+                    websocket,
                     websocket_error(transcriber.load_error, affects_readiness=True)
                 )
             elif transcriber.model is not None:
-                await websocket.send_json({"type": "ready"})
+                await send_json(websocket, {"type": "ready"})
 
         while True:
             message = await websocket.receive()
@@ -399,18 +648,25 @@ async def websocket_endpoint(websocket: WebSocket):
             if "bytes" in message:
                 # Binary audio data - just accumulate, no partial transcription
                 # Partial transcriptions were causing O(n²) work and slowdowns
-                if is_recording:
-                    audio_buffer.add_chunk(message["bytes"])
+                if is_recording and not audio_buffer.add_chunk(message["bytes"]):
+                    if not is_truncated:
+                        # Not reported to the client until "end": an error here
+                        # would cancel the recording the user is still holding
+                        is_truncated = True
+                        logger.warning(
+                            f"Recording exceeded {MAX_RECORDING_SECONDS}s, dropping further audio"
+                        )
 
             elif "text" in message:
                 # JSON control message
                 try:
-                    data = json.loads(message["text"])
+                    data = orjson.loads(message["text"])
                     msg_type = data.get("type")
 
                     if msg_type == "start":
                         if not transcriber:
-                            await websocket.send_json(
+                            await send_json(
+                                websocket,
                                 websocket_error(
                                     "Transcription server is unavailable",
                                     affects_readiness=True,
@@ -419,7 +675,8 @@ async def websocket_endpoint(websocket: WebSocket):
                             continue
 
                         if transcriber._loading:
-                            await websocket.send_json(
+                            await send_json(
+                                websocket,
                                 websocket_error(
                                     "Speech model is still loading",
                                     affects_readiness=True,
@@ -428,7 +685,8 @@ async def websocket_endpoint(websocket: WebSocket):
                             continue
 
                         if transcriber.load_error:
-                            await websocket.send_json(
+                            await send_json(
+                                websocket,
                                 websocket_error(
                                     transcriber.load_error,
                                     affects_readiness=True,
@@ -437,6 +695,7 @@ async def websocket_endpoint(websocket: WebSocket):
                             continue
 
                         is_recording = True
+                        is_truncated = False
                         audio_buffer.clear()
                         logger.info("Recording started")
 
@@ -444,30 +703,15 @@ async def websocket_endpoint(websocket: WebSocket):
                         is_recording = False
                         logger.info(f"Recording ended, duration: {audio_buffer.duration:.2f}s")
 
-                        # Final transcription
-                        audio = audio_buffer.get_audio()
-                        logger.info(f"Processing {len(audio)} samples...")
-                        text = ""
-                        if len(audio) > 0 and transcriber:
-                            try:
-                                text = await transcriber.transcribe(audio)
-                                logger.info(f"Transcription: {text}")
-                            except Exception as transcribe_error:
-                                logger.error(f"Transcription failed: {transcribe_error}")
-                                await websocket.send_json(
-                                    websocket_error(str(transcribe_error))
-                                )
-                                audio_buffer.clear()
-                                continue
-                        else:
-                            logger.info("No audio or transcriber not available")
-                        await websocket.send_json({"type": "final", "text": text})
-
+                        # Hand the recording to the transcription task and keep
+                        # reading, so the next "start" is not blocked on inference
+                        await recordings.put((audio_buffer.get_audio(), is_truncated))
                         audio_buffer.clear()
 
                     elif msg_type == "reload":
                         if not transcriber:
-                            await websocket.send_json(
+                            await send_json(
+                                websocket,
                                 websocket_error(
                                     "Transcription server is unavailable",
                                     affects_readiness=True,
@@ -476,7 +720,7 @@ async def websocket_endpoint(websocket: WebSocket):
                             continue
                         transcriber.ensure_loading(force=True)
 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning("Invalid JSON message received")
 
     except WebSocketDisconnect:
@@ -484,24 +728,38 @@ async def websocket_endpoint(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         try:
-            await websocket.send_json(websocket_error(str(e)))
+            await send_json(websocket, websocket_error(str(e)))
         except Exception as send_error:
             logger.debug(f"Failed to send error to client: {send_error}")
     finally:
+        # Results can no longer be delivered, so drop pending recordings
+        transcription_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await transcription_task
+
         # Remove from connected clients
         connected_clients.discard(websocket)
 
 
-def main():
-    """Main entry point."""
+def uvicorn_backends() -> dict[str, str]:
+    """Pick uvicorn's C-accelerated loop and HTTP parser when available.
 
-    def signal_handler(sig, frame):
-        logger.info("Shutting down...")
-        sys.exit(0)
+    uvloop and httptools ship with uvicorn[standard] but are not built for every
+    platform (uvloop has no Windows wheels), so fall back to the pure-Python ones.
+    The websocket protocol stays on "auto", which already picks websockets.
+    """
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+    }
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
 
+def main():
+    """Main entry point.
+
+    SIGINT/SIGTERM are left to uvicorn, whose graceful shutdown closes open
+    websockets and runs the lifespan teardown before the process exits.
+    """
     logger.info("Starting VoiceFlow server on ws://127.0.0.1:8765")
     uvicorn.run(
         app,
@@ -510,6 +768,7 @@ def main():
         log_level="info",
         ws_ping_interval=20,
         ws_ping_timeout=20,
+        **uvicorn_backends(),
     )
 
 
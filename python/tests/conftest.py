@@ -0,0 +1,14 @@
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def pytest_asyncio_loop_factories(config, item):
+    # Run async tests on the same C event loop uvicorn serves with in production,
+    # falling back to the stock loop where uvloop is not installed (e.g. Windows)
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
@@ -0,0 +1,41 @@
+import numpy as np
+
+from voiceflow_server import pcm
+
+
+def test_pcm16_to_float32_matches_numpy_scaling():
+    samples = np.array([0, 1, -1, 500, -500, 32767, -32768], dtype=np.int16)
+
+    audio = pcm.pcm16_to_float32(bytearray(samples.tobytes()))
+
+    assert audio.dtype == np.float32
+    np.testing.assert_array_equal(audio, samples.astype(np.float32) / 32768.0)
+
+
+def test_pcm16_to_float32_accepts_bytes_and_drops_partial_sample():
+    data = np.array([100, -100], dtype=np.int16).tobytes() + b"\x01"
+
+    audio = pcm.pcm16_to_float32(data)
+
+    np.testing.assert_array_equal(audio, np.array([100, -100], dtype=np.float32) / 32768.0)
+
+
+def test_pcm16_to_float32_handles_empty_input():
+    audio = pcm.pcm16_to_float32(bytearray())
+
+    assert audio.shape == (0,)
+    assert audio.dtype == np.float32
+
+
+def test_decode_loop_matches_numpy_fallback():
+    # Exercise the pure-Python loop Numba compiles, whichever path is active
+    samples = np.array([0, 1, -1, 500, -500, 32767, -32768], dtype=np.int16)
+    looped = np.empty(samples.shape, dtype=np.float32)
+    fallback = np.empty(samples.shape, dtype=np.float32)
+
+    pcm._decode_loop(samples, looped)
+    np.multiply(samples, pcm.PCM_SCALE, out=fallback)
+
+    assert looped.dtype == np.float32
+    np.testing.assert_array_equal(looped, fallback)
+    np.testing.assert_array_equal(looped, samples.astype(np.float32) / 32768.0)
@@ -0,0 +1,148 @@
+import json
+import logging
+
+import pytest
+
+pytest.importorskip("mlx.core")
+pytest.importorskip("parakeet_mlx")
+
+from mlx.utils import tree_flatten
+
+from voiceflow_server import server
+
+# A few-layer ParakeetTDT with random weights; big enough to quantize, small
+# enough to build in milliseconds
+TINY_CONFIG = {
+    "target": "nemo.collections.asr.models.rnnt_bpe_models.EncDecRNNTBPEModel",
+    "model_defaults": {"tdt_durations": [0, 1, 2, 3, 4]},
+    "preprocessor": {
+        "sample_rate": 16000,
+        "normalize": "per_feature",
+        "window_size": 0.025,
+        "window_stride": 0.01,
+        "window": "hann",
+        "features": 64,
+        "n_fft": 512,
+        "dither": 0.0,
+    },
+    "encoder": {
+        "feat_in": 64,
+        "n_layers": 2,
+        "d_model": 64,
+        "n_heads": 4,
+        "ff_expansion_factor": 2,
+        "subsampling_factor": 8,
+        "self_attention_model": "rel_pos",
+        "subsampling": "dw_striding",
+        "conv_kernel_size": 9,
+        "subsampling_conv_channels": 64,
+        "pos_emb_max_len": 5000,
+    },
+    "decoder": {
+        "blank_as_pad": True,
+        "vocab_size": 63,
+        "prednet": {"pred_hidden": 64, "pred_rnn_layers": 1},
+    },
+    "joint": {
+        "num_classes": 63,
+        "vocabulary": [f"t{i}" for i in range(63)],
+        "num_extra_outputs": 5,
+        "jointnet": {
+            "joint_hidden": 64,
+            "activation": "relu",
+            "encoder_hidden": 64,
+            "pred_hidden": 64,
+        },
+    },
+    "decoding": {
+        "model_type": "tdt",
+        "durations": [0, 1, 2, 3, 4],
+        "greedy": {"max_symbols": 10},
+    },
+}
+
+
+@pytest.fixture
+def hub_snapshot(tmp_path, monkeypatch):
+    """Point the server at a fake hub snapshot and a temporary quantized cache."""
+    snapshots = tmp_path / "hub" / "snapshots"
+    monkeypatch.setattr(server, "QUANTIZED_MODEL_DIR", tmp_path / "quantized")
+
+    def use_revision(revision):
+        config_path = snapshots / revision / "config.json"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text(json.dumps(TINY_CONFIG))
+        monkeypatch.setattr(
+            server,
+            "try_to_load_from_cache",
+            lambda _repo_id, filename: str(config_path.parent / filename),
+        )
+        return config_path
+
+    return use_revision
+
+
+def quantized_tiny_model():
+    model = server.from_config(TINY_CONFIG)
+    server.quantize_model(model)
+    return model
+
+
+def test_quantized_cache_round_trips_weights(hub_snapshot):
+    config_path = hub_snapshot("rev-a")
+    model = quantized_tiny_model()
+    transcriber = server.Transcriber()
+
+    transcriber._save_quantized_cache(model, config_path)
+    loaded = transcriber._load_quantized_cache()
+
+    assert loaded is not None
+    expected = dict(tree_flatten(model.parameters()))
+    actual = dict(tree_flatten(loaded.parameters()))
+    assert actual.keys() == expected.keys()
+    for name, value in expected.items():
+        assert (actual[name] == value).all(), name
+
+
+def test_quantized_cache_is_ignored_after_snapshot_changes(hub_snapshot, caplog):
+    caplog.set_level(logging.INFO, logger="voiceflow")
+    transcriber = server.Transcriber()
+    transcriber._save_quantized_cache(quantized_tiny_model(), hub_snapshot("rev-a"))
+
+    hub_snapshot("rev-b")
+
+    assert transcriber._load_quantized_cache() is None
+    assert "Quantized model cache is out of date" in caplog.text
+
+
+def test_quantized_cache_is_ignored_after_group_size_changes(hub_snapshot, monkeypatch, caplog):
+    caplog.set_level(logging.INFO, logger="voiceflow")
+    transcriber = server.Transcriber()
+    transcriber._save_quantized_cache(quantized_tiny_model(), hub_snapshot("rev-a"))
+
+    monkeypatch.setattr(server, "QUANTIZATION_GROUP_SIZE", 32)
+
+    # Rejected from the metadata, before any weights are read
+    assert transcriber._load_quantized_cache() is None
+    assert "Quantized model cache is out of date" in caplog.text
+
+
+def test_quantized_cache_without_metadata_is_ignored(hub_snapshot):
+    transcriber = server.Transcriber()
+    transcriber._save_quantized_cache(quantized_tiny_model(), hub_snapshot("rev-a"))
+
+    (server.QUANTIZED_MODEL_DIR / "metadata.json").unlink()
+
+    assert transcriber._load_quantized_cache() is None
+
+
+def test_forced_load_skips_quantized_cache(hub_snapshot, monkeypatch):
+    transcriber = server.Transcriber()
+    transcriber._save_quantized_cache(quantized_tiny_model(), hub_snapshot("rev-a"))
+    rebuilt = object()
+    monkeypatch.setattr(server.Transcriber, "_load_pretrained_model", lambda self: rebuilt)
+    monkeypatch.setattr(server.Transcriber, "_warmup", lambda self, model: None)
+
+    assert transcriber._load_model_sync(force=True) is rebuilt
+    cached = transcriber._load_model_sync()
+    assert cached is not None and cached is not rebuilt
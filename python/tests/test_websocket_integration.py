@@ -1,19 +1,35 @@
 import asyncio
-import json
+import struct
 
-import numpy as np
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from async_asgi_testclient import TestClient
 
 from voiceflow_server import server
 
+# The app, its lifespan and every test share one event loop in one thread
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Control frames exactly as the desktop client sends them
+START = '{"type":"start"}'
+END = '{"type":"end"}'
+
+# Little-endian 16-bit PCM payloads, matching what the desktop client streams.
+PCM_ROUNDTRIP = struct.pack("<4h", 0, 500, -500, 0)
+PCM_ERROR = struct.pack("<2h", 100, -100)
+PCM_FIRST_RECORDING = struct.pack("<3h", 1, 2, 3)
+PCM_SECOND_RECORDING = struct.pack("<2h", 4, 5)
+PCM_CAP_CHUNKS = (
+    struct.pack("<4h", 1, 2, 3, 4),
+    struct.pack("<4h", 5, 6, 7, 8),
+    struct.pack("<2h", 9, 10),
+)
+
 
 class BootstrapTranscriber:
     def __init__(self):
         self.model = object()
         self._loading = False
-        self._loaded = asyncio.Event()
-        self._loaded.set()
         self.load_error = None
         self.loading_stage = "ready"
         self.loading_progress = 1.0
@@ -24,10 +40,10 @@ class BootstrapTranscriber:
         return task
 
     async def load_model(self):
-        self._loaded.set()
+        return None
 
     async def wait_until_ready(self):
-        await self._loaded.wait()
+        return None
 
     async def transcribe(self, _audio_data, sample_rate=16000):
         return f"sample_rate={sample_rate}"
@@ -44,92 +60,187 @@ class BootstrapTranscriber:
         }
 
 
-@pytest.fixture
-def client(monkeypatch):
-    monkeypatch.setattr(server, "Transcriber", BootstrapTranscriber)
-    server.connected_clients.clear()
-    server.transcriber = None
-    with TestClient(server.app) as test_client:
-        yield test_client
-    server.connected_clients.clear()
-    server.transcriber = None
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    # One lifespan for the whole session. Tests swap in their own transcriber by
+    # patching get_transcriber, so no server module state is shared between them
+    # and the suite can run under pytest-xdist (-n auto).
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(server, "Transcriber", BootstrapTranscriber)
+        async with TestClient(server.app) as test_client:
+            yield test_client
 
 
-def test_websocket_roundtrip_transcription(client):
-    class ReadyTranscriber:
-        _loading = False
-        load_error = None
-        model = object()
-        loading_stage = "ready"
-        loading_progress = 1.0
-        loading_message = "ready"
+def use_transcriber(monkeypatch, transcriber):
+    monkeypatch.setattr(server, "get_transcriber", lambda: transcriber)
 
-        async def wait_until_ready(self):
-            return None
 
-        async def transcribe(self, _audio_data, sample_rate=16000):
-            return f"transcribed@{sample_rate}"
+class ReadyTranscriber:
+    _loading = False
+    load_error = None
+    model = object()
+    loading_stage = "ready"
+    loading_progress = 1.0
+    loading_message = "ready"
 
-    server.transcriber = ReadyTranscriber()
+    async def wait_until_ready(self):
+        return None
+
+    async def transcribe(self, _audio_data, sample_rate=16000):
+        return f"transcribed@{sample_rate}"
 
-    with client.websocket_connect("/ws") as ws:
-        assert ws.receive_json() == {"type": "ready"}
-        ws.send_text(json.dumps({"type": "start"}))
-        ws.send_bytes(np.array([0, 500, -500, 0], dtype=np.int16).tobytes())
-        ws.send_text(json.dumps({"type": "end"}))
-        assert ws.receive_json() == {"type": "final", "text": "transcribed@16000"}
 
+class CountingTranscriber(ReadyTranscriber):
+    async def transcribe(self, audio_data, sample_rate=16000):
+        return f"samples={len(audio_data)}"
 
-def test_websocket_reports_transcription_errors(client):
-    class FailingTranscriber:
-        _loading = False
-        load_error = None
-        model = object()
-        loading_stage = "ready"
-        loading_progress = 1.0
-        loading_message = "ready"
 
-        async def wait_until_ready(self):
-            return None
+class FailingTranscriber(ReadyTranscriber):
+    async def transcribe(self, _audio_data, sample_rate=16000):
+        raise RuntimeError(f"failed@{sample_rate}")
 
-        async def transcribe(self, _audio_data, sample_rate=16000):
-            raise RuntimeError(f"failed@{sample_rate}")
 
-    server.transcriber = FailingTranscriber()
+class BlockingTranscriber(CountingTranscriber):
+    def __init__(self):
+        self.transcribing = asyncio.Event()
+        self.release = asyncio.Event()
 
-    with client.websocket_connect("/ws") as ws:
-        assert ws.receive_json() == {"type": "ready"}
-        ws.send_text(json.dumps({"type": "start"}))
-        ws.send_bytes(np.array([100, -100], dtype=np.int16).tobytes())
-        ws.send_text(json.dumps({"type": "end"}))
-        message = ws.receive_json()
-        assert message["type"] == "error"
-        assert "failed@16000" in message["error"]
-        assert message.get("affectsReadiness") is not True
+    async def transcribe(self, audio_data, sample_rate=16000):
+        self.transcribing.set()
+        await self.release.wait()
+        return await super().transcribe(audio_data, sample_rate)
 
 
-def test_websocket_returns_model_load_error(client):
-    class LoadErrorTranscriber:
-        _loading = False
-        load_error = "model failed to initialize"
-        model = None
-        loading_stage = "error"
-        loading_progress = 0.0
-        loading_message = "error"
+class LoadErrorTranscriber:
+    _loading = False
+    load_error = "model failed to initialize"
+    model = None
+    loading_stage = "error"
+    loading_progress = 0.0
+    loading_message = "error"
 
-        async def wait_until_ready(self):
-            return None
+    async def wait_until_ready(self):
+        return None
+
+
+async def run_script(ws, script):
+    # Frames go out back to back with no receive in between, the way the desktop
+    # client streams them. The server must not need a per-frame ack.
+    for kind, payload in script:
+        if kind == "text":
+            await ws.send_text(payload)
+        else:
+            await ws.send_bytes(payload)
+
+
+def recording(*chunks):
+    return [
+        ("text", START),
+        *(("bytes", chunk) for chunk in chunks),
+        ("text", END),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("transcriber", "script", "expected"),
+    [
+        pytest.param(
+            ReadyTranscriber(),
+            recording(PCM_ROUNDTRIP),
+            [
+                {"type": "ready"},
+                {"type": "final", "text": "transcribed@16000"},
+            ],
+            id="roundtrip",
+        ),
+        pytest.param(
+            CountingTranscriber(),
+            recording(PCM_FIRST_RECORDING) + recording(PCM_SECOND_RECORDING),
+            [
+                {"type": "ready"},
+                {"type": "final", "text": "samples=3"},
+                {"type": "final", "text": "samples=2"},
+            ],
+            id="back-to-back-recordings-in-order",
+        ),
+        pytest.param(
+            FailingTranscriber(),
+            recording(PCM_ERROR),
+            [
+                {"type": "ready"},
+                # Per-recording failures must not mark the model as unavailable
+                {"type": "error", "error": "failed@16000"},
+            ],
+            id="transcription-error",
+        ),
+        pytest.param(
+            LoadErrorTranscriber(),
+            [],
+            [
+                {
+                    "type": "error",
+                    "error": "model failed to initialize",
+                    "affectsReadiness": True,
+                },
+            ],
+            id="model-load-error",
+        ),
+    ],
+)
+async def test_websocket_session(client, monkeypatch, transcriber, script, expected):
+    use_transcriber(monkeypatch, transcriber)
+
+    async with client.websocket_connect("/ws") as ws:
+        await run_script(ws, script)
+        # Exact equality: an ack inserted between pipelined frames would show up
+        # here as an unexpected message ahead of the result
+        assert [await ws.receive_json() for _ in expected] == expected
+        assert ws.output_queue.empty()
+
+
+async def test_websocket_keeps_reading_while_transcribing(client, monkeypatch):
+    transcriber = BlockingTranscriber()
+    use_transcriber(monkeypatch, transcriber)
+
+    async with client.websocket_connect("/ws") as ws:
+        assert await ws.receive_json() == {"type": "ready"}
+        await run_script(ws, recording(PCM_FIRST_RECORDING))
+        await asyncio.wait_for(transcriber.transcribing.wait(), timeout=1)
+
+        # With the first recording still being transcribed, a "start" must get
+        # its reply straight away rather than queue behind the result
+        transcriber._loading = True
+        await ws.send_text(START)
+        assert await asyncio.wait_for(ws.receive_json(), timeout=1) == {
+            "type": "error",
+            "error": "Speech model is still loading",
+            "affectsReadiness": True,
+        }
+
+        transcriber.release.set()
+        assert await ws.receive_json() == {"type": "final", "text": "samples=3"}
+        assert ws.output_queue.empty()
 
-    server.transcriber = LoadErrorTranscriber()
 
-    with client.websocket_connect("/ws") as ws:
-        message = ws.receive_json()
-        assert message["type"] == "error"
-        assert message["error"] == "model failed to initialize"
-        assert message["affectsReadiness"] is True
+async def test_websocket_caps_recording_length(client, monkeypatch):
+    monkeypatch.setattr(server, "MAX_RECORDING_SECONDS", 6 / 16000)
+    use_transcriber(monkeypatch, CountingTranscriber())
+
+    async with client.websocket_connect("/ws") as ws:
+        assert await ws.receive_json() == {"type": "ready"}
+        await run_script(ws, recording(*PCM_CAP_CHUNKS))
+        assert await ws.receive_json() == {
+            "type": "final",
+            "text": "samples=6",
+            "truncated": True,
+        }
+        # The cap applies per recording, so the next one is not flagged
+        await run_script(ws, recording(PCM_SECOND_RECORDING))
+        assert await ws.receive_json() == {"type": "final", "text": "samples=2"}
+        assert ws.output_queue.empty()
 
 
-def test_health_endpoint_reports_transcriber_state(client):
+async def test_health_endpoint_reports_transcriber_state(client, monkeypatch):
     class HealthTranscriber:
         def health_snapshot(self):
             return {
@@ -142,9 +253,9 @@ def test_health_endpoint_reports_transcriber_state(client):
                 "error": None,
             }
 
-    server.transcriber = HealthTranscriber()
+    use_transcriber(monkeypatch, HealthTranscriber())
 
-    response = client.get("/health")
+    response = await client.get("/health")
 
     assert response.status_code == 200
     assert response.json() == {
@@ -158,7 +269,7 @@ def test_health_endpoint_reports_transcriber_state(client):
     }
 
 
-def test_reload_endpoint_requests_forced_reload(client):
+async def test_reload_endpoint_requests_forced_reload(client, monkeypatch):
     calls = []
 
     class ReloadableTranscriber:
@@ -177,9 +288,9 @@ def test_reload_endpoint_requests_forced_reload(client):
                 "error": "Failed",
             }
 
-    server.transcriber = ReloadableTranscriber()
+    use_transcriber(monkeypatch, ReloadableTranscriber())
 
-    response = client.post("/model/reload")
+    response = await client.post("/model/reload")
 
     assert response.status_code == 202
     assert response.json() == {
@@ -26,9 +26,11 @@ hiddenimports += [
     'uvicorn.logging',
     'uvicorn.loops',
     'uvicorn.loops.auto',
+    'uvicorn.loops.uvloop',
     'uvicorn.protocols',
     'uvicorn.protocols.http',
     'uvicorn.protocols.http.auto',
+    'uvicorn.protocols.http.httptools_impl',
     'uvicorn.protocols.websockets',
     'uvicorn.protocols.websockets.auto',
     'uvicorn.lifespan',
@@ -36,9 +38,9 @@ hiddenimports += [
     'uvloop',
     'httptools',
     'websockets',
-    'soundfile',
     'numpy',
     'numba',
+    'voiceflow_server.pcm',
 ]
 
 a = Analysis(